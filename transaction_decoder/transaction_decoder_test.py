@@ -1,4 +1,12 @@
-from transaction_decoder.transaction_decoder import TransactionDecoder, TransactionToDecode
+import base64
+from types import SimpleNamespace
+from typing import Optional
+
+from transaction_decoder.transaction_decoder import (
+    TransactionDecoder,
+    TransactionMetadata,
+    TransactionToDecode,
+)
 
 
 class TestTransactionDecoder:
@@ -220,3 +228,173 @@ class TestTransactionDecoder:
             assert metadata.transfers[1].value == 1389278024872597502641297
             if metadata.transfers[1].properties:
                 assert metadata.transfers[1].properties.token == "USDC-350c4e"
+
+    def test_function_args_to_dict(self):
+        tx_to_decode = TransactionToDecode()
+        tx_to_decode.sender = (
+            "erd18w6yj09l9jwlpj5cjqq9eccfgulkympv7d4rj6vq4u49j8fpwzwsvx7e85"
+        )
+        tx_to_decode.receiver = (
+            "erd18w6yj09l9jwlpj5cjqq9eccfgulkympv7d4rj6vq4u49j8fpwzwsvx7e85"
+        )
+        tx_to_decode.value = "0"
+        tx_to_decode.data = "RVNEVE5GVFRyYW5zZmVyQDRjNGI0ZDQ1NTgyZDYxNjE2MjM5MzEzMEAyZmI0ZTlAZTQwZjE2OTk3MTY1NWU2YmIwNGNAMDAwMDAwMDAwMDAwMDAwMDA1MDBkZjNiZWJlMWFmYTEwYzQwOTI1ZTgzM2MxNGE0NjBlMTBhODQ5ZjUwYTQ2OEA3Mzc3NjE3MDVmNmM2YjZkNjU3ODVmNzQ2ZjVmNjU2NzZjNjRAMGIzNzdmMjYxYzNjNzE5MUA="
+
+        decoder = TransactionDecoder()
+        metadata = decoder.get_transaction_metadata(tx_to_decode)
+
+        assert metadata.function_args is not None
+        assert len(metadata.function_args) == 2
+        assert metadata.function_args[0] == "0b377f261c3c7191"
+        assert metadata.function_args[-1] == ""
+        assert metadata.to_dict()["function_args"] == ["0b377f261c3c7191", ""]
+
+    def test_prepared_transaction_is_refreshed_on_update(self):
+        tx_to_decode = TransactionToDecode()
+        tx_to_decode.value = "1000"
+        tx_to_decode.data = "d2l0aGRyYXdHbG9iYWxPZmZlckAwMTczZDA="
+        tx_to_decode.prepare()
+
+        assert tx_to_decode.value_int == 1000
+        assert tx_to_decode.decoded_data == b"withdrawGlobalOffer@0173d0"
+
+        tx_to_decode.value = "2000"
+        tx_to_decode.data = "RVNEVFRyYW5zZmVyQDU0NDU1MzU0MmQzMjY1MzQzMDY0MzdAMDI1NDBiZTQwMA=="
+
+        metadata = TransactionDecoder().get_transaction_metadata(tx_to_decode)
+
+        assert metadata.value == 10000000000
+        assert tx_to_decode.value_int == 2000
+
+    def test_decode_batch(self):
+        sc_call = TransactionToDecode()
+        sc_call.sender = "erd1wcn58spj6rnsexugjq3p2fxxq4t3l3kt7np078zwkrxu70ul69fqvyjnq2"
+        sc_call.receiver = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+        sc_call.data = "d2l0aGRyYXdHbG9iYWxPZmZlckAwMTczZDA="
+
+        esdt_transfer = TransactionToDecode()
+        esdt_transfer.sender = "erd1wcn58spj6rnsexugjq3p2fxxq4t3l3kt7np078zwkrxu70ul69fqvyjnq2"
+        esdt_transfer.receiver = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+        esdt_transfer.data = "RVNEVFRyYW5zZmVyQDU0NDU1MzU0MmQzMjY1MzQzMDY0MzdAMDI1NDBiZTQwMA=="
+
+        decoder = TransactionDecoder()
+        batch = decoder.decode_batch([sc_call, esdt_transfer])
+
+        assert len(batch) == 2
+        assert batch[0].function_name == "withdrawGlobalOffer"
+        assert batch[0].function_args == ["0173d0"]
+        assert batch[1].value == 10000000000
+        assert batch[1].transfers
+        assert batch[1].transfers[0].properties
+        assert batch[1].transfers[0].properties.identifier == "TEST-2e40d7"
+
+    def test_multi_transfer_many_transfers(self):
+        transfers = ["4c4b4d45582d616162393130", "2fe3b0", "0a"] * 5
+        transfers += ["555344432d333530633465", "", "0b"] * 5
+        data = "@".join(
+            [
+                "MultiESDTNFTTransfer",
+                "00000000000000000500df3bebe1afa10c40925e833c14a460e10a849f50a468",
+                "0a",
+                *transfers,
+                "737761705f6c6b6d65785f746f5f65676c64",
+                "01",
+            ]
+        )
+
+        tx_to_decode = TransactionToDecode()
+        tx_to_decode.sender = (
+            "erd1lkrrrn3ws9sp854kdpzer9f77eglqpeet3e3k3uxvqxw9p3eq6xqxj43r9"
+        )
+        tx_to_decode.receiver = (
+            "erd1lkrrrn3ws9sp854kdpzer9f77eglqpeet3e3k3uxvqxw9p3eq6xqxj43r9"
+        )
+        tx_to_decode.data = base64.b64encode(data.encode()).decode()
+
+        decoder = TransactionDecoder()
+        metadata = decoder.get_transaction_metadata(tx_to_decode)
+
+        assert (
+            metadata.receiver
+            == "erd1qqqqqqqqqqqqqpgqmua7hcd05yxypyj7sv7pffrquy9gf86s535qxct34s"
+        )
+        assert metadata.function_name == "swap_lkmex_to_egld"
+        assert metadata.function_args == ["01"]
+        assert metadata.transfers
+        assert len(metadata.transfers) == 10
+        assert metadata.transfers[0].value == 10
+        assert metadata.transfers[0].properties
+        assert metadata.transfers[0].properties.identifier == "LKMEX-aab910-2fe3b0"
+        assert metadata.transfers[9].value == 11
+        assert metadata.transfers[9].properties
+        assert metadata.transfers[9].properties.token == "USDC-350c4e"
+
+    def test_is_hex(self):
+        decoder = TransactionDecoder()
+
+        assert decoder.is_hex("0173d0")
+        assert decoder.is_hex("ABcd")
+        assert decoder.is_hex("")
+        assert decoder.is_hex("41 42")
+        assert not decoder.is_hex("abc")
+        assert not decoder.is_hex("4 142")
+        assert not decoder.is_hex("0x01")
+        assert not decoder.is_hex("é1")
+
+    def test_subclass_handler_override(self):
+        class CustomDecoder(TransactionDecoder):
+            def get_esdt_transaction_metadata(
+                self, metadata: TransactionMetadata
+            ) -> Optional[TransactionMetadata]:
+                result = super().get_esdt_transaction_metadata(metadata)
+                if result:
+                    result.function_name = "custom"
+                return result
+
+        tx_to_decode = TransactionToDecode()
+        tx_to_decode.sender = (
+            "erd1wcn58spj6rnsexugjq3p2fxxq4t3l3kt7np078zwkrxu70ul69fqvyjnq2"
+        )
+        tx_to_decode.receiver = (
+            "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+        )
+        tx_to_decode.data = (
+            "RVNEVFRyYW5zZmVyQDU0NDU1MzU0MmQzMjY1MzQzMDY0MzdAMDI1NDBiZTQwMA=="
+        )
+
+        metadata = CustomDecoder().get_transaction_metadata(tx_to_decode)
+
+        assert metadata.function_name == "custom"
+        assert metadata.value == 10000000000
+
+    def test_base64_decode_ignores_non_ascii_characters(self):
+        decoder = TransactionDecoder()
+
+        assert decoder.base64_decode("QUJD") == "ABC"
+        assert decoder.base64_decode("QUJDé") == "ABC"
+
+    def test_public_hex_helpers_accept_whitespace(self):
+        decoder = TransactionDecoder()
+
+        assert decoder.hex_to_string("41 42") == "AB"
+        assert (
+            decoder.bech32_encode(
+                "00000000000000000500df3bebe1afa10c40925e833c14a460e10a849f50a468 "
+            )
+            == "erd1qqqqqqqqqqqqqpgqmua7hcd05yxypyj7sv7pffrquy9gf86s535qxct34s"
+        )
+
+    def test_duck_typed_transaction(self):
+        tx_to_decode = SimpleNamespace(
+            sender="erd1wcn58spj6rnsexugjq3p2fxxq4t3l3kt7np078zwkrxu70ul69fqvyjnq2",
+            receiver="erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th",
+            data="d2l0aGRyYXdHbG9iYWxPZmZlckAwMTczZDA=",
+            value="5",
+        )
+
+        decoder = TransactionDecoder()
+        metadata = decoder.get_transaction_metadata(tx_to_decode)  # type: ignore
+
+        assert metadata.value == 5
+        assert metadata.function_name == "withdrawGlobalOffer"
+        assert metadata.function_args == ["0173d0"]